@@ -4,14 +4,107 @@ A command-line application for managing contacts with persistent storage.
 """
 
 import json
+import mmap
 import os
 import re
-from typing import List, Dict, Optional
+import shutil
+import sys
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+
+# orjson is a much faster drop-in for json; fall back to the stdlib without it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 # File path for storing contacts
 CONTACTS_FILE = "contacts.json"
 
+# Files larger than this are memory-mapped instead of read in one go
+MMAP_THRESHOLD = 64 * 1024
+
+# Number of unsaved changes after which the contacts are written to disk
+AUTOSAVE_EVERY = 10
+
+# Precompiled email validation pattern
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Translation table deleting the formatting characters allowed in phone numbers
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' \t\n\r\f\v-()+')
+
+# Whether stdin is a terminal, and the remaining piped lines when it is not;
+# both are filled in by the first _input() call
+_STDIN_IS_TTY: Optional[bool] = None
+_STDIN_LINES: Optional[Iterator[str]] = None
+
+
+def _input(prompt: str = "") -> str:
+    """
+    Read one line of user input.
+    
+    Interactive sessions use input() as usual. When stdin is piped (scripted
+    or bulk imports), lines are taken from the buffered stdin iterator,
+    which reads the pipe in blocks rather than per prompt but never waits
+    for more input than the next line needs.
+    
+    Args:
+        prompt: Text to show before reading
+        
+    Returns:
+        The line read, without its trailing newline
+        
+    Raises:
+        EOFError: If piped input has run out
+    """
+    global _STDIN_IS_TTY, _STDIN_LINES
+    if _STDIN_IS_TTY is None:
+        _STDIN_IS_TTY = sys.stdin.isatty()
+        if not _STDIN_IS_TTY:
+            _STDIN_LINES = iter(sys.stdin)
+    
+    if _STDIN_IS_TTY or _STDIN_LINES is None:
+        return input(prompt)
+    
+    # Flush like input() does, so a driver waiting for the prompt sees it
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    try:
+        line = next(_STDIN_LINES)
+    except StopIteration:
+        raise EOFError("EOF when reading a line") from None
+    return line[:-1] if line.endswith('\n') else line
+
+
+def _parse_json(data) -> List[Dict[str, str]]:
+    """
+    Parse JSON from bytes or a buffer, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON as bytes or a bytes-like buffer
+        
+    Returns:
+        The decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _dump_json(contacts: List[Dict[str, str]]) -> bytes:
+    """
+    Serialize contacts to indented JSON bytes, using orjson when installed.
+    
+    Args:
+        contacts: List of contact dictionaries
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(contacts, option=orjson.OPT_INDENT_2)
+    return json.dumps(contacts, indent=4).encode('utf-8')
+
 
 def load_contacts() -> List[Dict[str, str]]:
     """
@@ -20,25 +113,58 @@ def load_contacts() -> List[Dict[str, str]]:
     Returns:
         List of contact dictionaries. Returns empty list if file doesn't exist.
     """
-    if os.path.exists(CONTACTS_FILE):
-        try:
-            with open(CONTACTS_FILE, 'r') as file:
-                return json.load(file)
-        except json.JSONDecodeError:
-            print("Warning: Contacts file is corrupted. Starting with empty contact list.")
-            return []
-    return []
+    if not os.path.exists(CONTACTS_FILE):
+        return []
+    
+    try:
+        # Map large files straight from the page cache
+        if os.path.getsize(CONTACTS_FILE) > MMAP_THRESHOLD:
+            with open(CONTACTS_FILE, 'rb') as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        contacts = _parse_json(view)
+        else:
+            with open(CONTACTS_FILE, 'rb') as file:
+                contacts = _parse_json(file.read())
+    except json.JSONDecodeError:
+        print("Warning: Contacts file is corrupted. Starting with empty contact list.")
+        return []
+    return contacts
 
 
-def save_contacts(contacts: List[Dict[str, str]]) -> None:
+def save_contacts(contacts: List[Dict[str, str]], sync: bool = True) -> None:
     """
     Save contacts to the JSON file.
     
+    The data is written to a temporary file which then replaces the
+    contacts file, so a crash mid-write never leaves a corrupted file. The
+    existing file's permissions are kept, and if the contacts file is a
+    symlink, the file it points to is replaced rather than the link.
+    
     Args:
         contacts: List of contact dictionaries to save
+        sync: Flush the data to disk before replacing the file
     """
-    with open(CONTACTS_FILE, 'w') as file:
-        json.dump(contacts, file, indent=4)
+    # Serialize once and hand the whole payload to a single write() call
+    data = _dump_json(contacts)
+    target = os.path.realpath(CONTACTS_FILE)
+    tmp_file = target + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as file:
+            file.write(data)
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_file)
+        os.replace(tmp_file, target)
+    except BaseException:
+        # Don't leave a half-written temporary file behind
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
     print("✓ Contacts saved successfully.")
 
 
@@ -52,9 +178,16 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise
     """
-    # Basic email validation pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Cheap structural checks reject most bad input before the regex runs:
+    # a non-empty local part before '@', and a domain with a dot followed
+    # by at least two characters
+    at = email.rfind('@')
+    if at < 1:
+        return False
+    dot = email.rfind('.')
+    if dot < at + 2 or dot > len(email) - 3:
+        return False
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_phone(phone: str) -> bool:
@@ -68,60 +201,264 @@ def validate_phone(phone: str) -> bool:
         True if phone contains at least some digits, False otherwise
     """
     # Remove common formatting characters
-    digits_only = re.sub(r'[\s\-\(\)\+]', '', phone)
+    digits_only = phone.translate(_PHONE_STRIP_TABLE)
     # Check if it contains at least 7 digits
     return digits_only.isdigit() and len(digits_only) >= 7
 
 
-def contact_exists(contacts: List[Dict[str, str]], name: str) -> bool:
+def build_name_index(names_lc: List[Optional[str]]) -> Dict[str, int]:
+    """
+    Build a lookup table mapping lowercased contact names to list positions.
+    
+    Args:
+        names_lc: Lowercased contact names in list order (None for deleted)
+        
+    Returns:
+        Dictionary mapping each lowercased name to its index
+    """
+    name_index: Dict[str, int] = {}
+    for i, name_lc in enumerate(names_lc):
+        # Keep the first occurrence, matching the old linear-scan behaviour
+        if name_lc is not None:
+            name_index.setdefault(name_lc, i)
+    return name_index
+
+
+def contact_exists(name_index: Dict[str, int], name: str) -> bool:
     """
     Check if a contact with the given name already exists.
     
     Args:
-        contacts: List of existing contacts
+        name_index: Lookup table built by build_name_index
         name: Name to check
         
     Returns:
         True if contact exists, False otherwise
     """
-    return any(contact['name'].lower() == name.lower() for contact in contacts)
+    return name.lower() in name_index
 
 
-def find_contact_index(contacts: List[Dict[str, str]], name: str) -> Optional[int]:
+def find_contact_index(name_index: Dict[str, int], name: str) -> Optional[int]:
     """
     Find the index of a contact by name (case-insensitive).
     
     Args:
-        contacts: List of contacts
+        name_index: Lookup table built by build_name_index
         name: Name to search for
         
     Returns:
         Index of the contact if found, None otherwise
     """
-    for i, contact in enumerate(contacts):
-        if contact['name'].lower() == name.lower():
-            return i
-    return None
+    return name_index.get(name.lower())
 
 
-def add_contact(contacts: List[Dict[str, str]]) -> None:
+class ContactStore:
+    """
+    In-memory contact list with a name index and deferred saving.
+    
+    Contacts are kept as parallel lists (one per field) rather than a list
+    of dicts, so name scans walk a single list of strings. Deleted contacts
+    leave a None tombstone in every list until the next save compacts them.
+    Names are identified by their lower() form (names_lc, name_index), as
+    the duplicate check always has; the case-folded names_cf snapshot is
+    only used for searching, so names such as 'Straße' and 'STRASSE' stay
+    separate contacts.
+    Changes are only marked as pending; the file is rewritten once enough
+    changes have accumulated or when save() is called on exit.
+    """
+    
+    def __init__(self, contacts: List[Dict[str, str]]):
+        """
+        Split a list of contact dictionaries into per-field lists.
+        
+        Args:
+            contacts: List of contact dictionaries
+        """
+        # Each list holds None in the slots of deleted contacts
+        names = [contact['name'] for contact in contacts]
+        self.names: List[Optional[str]] = list(names)
+        self.names_lc: List[Optional[str]] = [name.lower() for name in names]
+        self.names_cf: List[Optional[str]] = [name.casefold() for name in names]
+        self.phones: List[Optional[str]] = [contact['phone'] for contact in contacts]
+        self.emails: List[Optional[str]] = [contact['email'] for contact in contacts]
+        self.name_index = build_name_index(self.names_lc)
+        self.tombstones = 0
+        self.dirty = False
+        self.pending = 0
+    
+    def __len__(self) -> int:
+        """Return the number of contacts, not counting deleted ones."""
+        return len(self.names) - self.tombstones
+    
+    def indices(self) -> List[int]:
+        """
+        Get the positions of all contacts that have not been deleted.
+        
+        Returns:
+            Indices of the live contacts in store order
+        """
+        if not self.tombstones:
+            return list(range(len(self.names)))
+        return [i for i, name in enumerate(self.names) if name is not None]
+    
+    def get(self, index: int) -> Tuple[str, str, str]:
+        """
+        Get the details of a contact that has not been deleted.
+        
+        Args:
+            index: Position of the contact
+            
+        Returns:
+            Tuple of (name, phone, email)
+        """
+        name, phone, email = self.names[index], self.phones[index], self.emails[index]
+        assert name is not None and phone is not None and email is not None
+        return name, phone, email
+    
+    def to_list(self) -> List[Dict[str, str]]:
+        """
+        Rebuild the list of contact dictionaries for saving.
+        
+        Returns:
+            List of contact dictionaries in store order
+        """
+        contacts = []
+        for i in self.indices():
+            name, phone, email = self.get(i)
+            contacts.append({'name': name, 'phone': phone, 'email': email})
+        return contacts
+    
+    def compact(self) -> None:
+        """Drop the tombstones left by deletions and rebuild the name index."""
+        if not self.tombstones:
+            return
+        live = self.indices()
+        self.names = [self.names[i] for i in live]
+        self.names_lc = [self.names_lc[i] for i in live]
+        self.names_cf = [self.names_cf[i] for i in live]
+        self.phones = [self.phones[i] for i in live]
+        self.emails = [self.emails[i] for i in live]
+        self.name_index = build_name_index(self.names_lc)
+        self.tombstones = 0
+    
+    def search(self, term: str) -> List[int]:
+        """
+        Find contacts whose name contains a case-folded search term.
+        
+        Args:
+            term: Case-folded text to look for
+            
+        Returns:
+            Indices of the matching contacts
+        """
+        return [
+            i for i, name_cf in enumerate(self.names_cf)
+            if name_cf is not None and term in name_cf
+        ]
+    
+    def add(self, name: str, phone: str, email: str) -> None:
+        """
+        Append a new contact.
+        
+        Args:
+            name: Contact name
+            phone: Phone number
+            email: Email address
+        """
+        name_lc = name.lower()
+        self.names.append(name)
+        self.names_lc.append(name_lc)
+        self.names_cf.append(name.casefold())
+        self.phones.append(phone)
+        self.emails.append(email)
+        self.name_index[name_lc] = len(self.names) - 1
+        self.mark_changed()
+    
+    def update(self, index: int, name: str, phone: str, email: str) -> None:
+        """
+        Replace the details of the contact at the given index.
+        
+        Args:
+            index: Position of the contact
+            name: New contact name
+            phone: New phone number
+            email: New email address
+        """
+        # Re-key the index if the name changed
+        if name != self.names[index]:
+            old_lc = self.names_lc[index]
+            if old_lc is not None:
+                self.name_index.pop(old_lc, None)
+            name_lc = name.lower()
+            self.names[index] = name
+            self.names_lc[index] = name_lc
+            self.names_cf[index] = name.casefold()
+            self.name_index[name_lc] = index
+        self.phones[index] = phone
+        self.emails[index] = email
+        self.mark_changed()
+    
+    def remove(self, index: int) -> None:
+        """
+        Delete the contact at the given index.
+        
+        The slot is only marked empty so later positions stay valid; the
+        lists are compacted on the next save.
+        
+        Args:
+            index: Position of the contact
+        """
+        name_lc = self.names_lc[index]
+        if name_lc is not None:
+            self.name_index.pop(name_lc, None)
+        self.names[index] = None
+        self.names_lc[index] = None
+        self.names_cf[index] = None
+        self.phones[index] = None
+        self.emails[index] = None
+        self.tombstones += 1
+        self.mark_changed()
+    
+    def mark_changed(self) -> None:
+        """Record a modification, saving once AUTOSAVE_EVERY have piled up."""
+        self.dirty = True
+        self.pending += 1
+        if self.pending >= AUTOSAVE_EVERY:
+            # Routine autosave; the save on exit is the one that fsyncs
+            self.save(sync=False)
+    
+    def save(self, sync: bool = True) -> None:
+        """
+        Write the contacts to disk if there are unsaved changes.
+        
+        Args:
+            sync: Flush the data to disk before replacing the file
+        """
+        if self.dirty:
+            self.compact()
+            save_contacts(self.to_list(), sync)
+            self.dirty = False
+            self.pending = 0
+
+
+def add_contact(store: ContactStore) -> None:
     """
     Add a new contact to the contact list.
     
     Args:
-        contacts: List of existing contacts
+        store: Contact store to add to
     """
     print("\n--- Add New Contact ---")
     
     # Get and validate name
     while True:
-        name = input("Enter name: ").strip()
+        name = _input("Enter name: ").strip()
         if not name:
             print("❌ Name cannot be empty. Please try again.")
             continue
-        if contact_exists(contacts, name):
+        if contact_exists(store.name_index, name):
             print(f"❌ A contact with the name '{name}' already exists.")
-            choice = input("Do you want to enter a different name? (y/n): ").strip().lower()
+            choice = _input("Do you want to enter a different name? (y/n): ").strip().lower()
             if choice != 'y':
                 print("Operation cancelled.")
                 return
@@ -130,7 +467,7 @@ def add_contact(contacts: List[Dict[str, str]]) -> None:
     
     # Get and validate phone number
     while True:
-        phone = input("Enter phone number: ").strip()
+        phone = _input("Enter phone number: ").strip()
         if not phone:
             print("❌ Phone number cannot be empty. Please try again.")
             continue
@@ -141,7 +478,7 @@ def add_contact(contacts: List[Dict[str, str]]) -> None:
     
     # Get and validate email
     while True:
-        email = input("Enter email address: ").strip()
+        email = _input("Enter email address: ").strip()
         if not email:
             print("❌ Email cannot be empty. Please try again.")
             continue
@@ -150,122 +487,130 @@ def add_contact(contacts: List[Dict[str, str]]) -> None:
             continue
         break
     
-    # Create and add the new contact
-    new_contact = {
-        'name': name,
-        'phone': phone,
-        'email': email
-    }
-    
-    contacts.append(new_contact)
-    save_contacts(contacts)
+    # Add the new contact
+    store.add(name, phone, email)
     print(f"\n✓ Contact '{name}' added successfully!")
 
 
-def view_all_contacts(contacts: List[Dict[str, str]]) -> None:
+def format_contacts(store: ContactStore, indices: Iterable[int]) -> List[str]:
+    """
+    Format contacts as a numbered listing.
+    
+    Args:
+        store: Contact store holding the contacts
+        indices: Positions of the contacts to include, in display order
+        
+    Returns:
+        Output lines, without trailing newlines
+    """
+    separator = "-" * 50
+    names, phones, emails = store.names, store.phones, store.emails
+    lines = []
+    for i, index in enumerate(indices, 1):
+        lines.append(f"{i}. {names[index]}")
+        lines.append(f"   Phone: {phones[index]}")
+        lines.append(f"   Email: {emails[index]}")
+        lines.append(separator)
+    return lines
+
+
+def view_all_contacts(store: ContactStore) -> None:
     """
     Display all contacts in a formatted manner.
     
     Args:
-        contacts: List of contacts to display
+        store: Contact store to display
     """
     print("\n--- All Contacts ---")
     
-    if not contacts:
+    if not len(store):
         print("No contacts found. The contact list is empty.")
         return
     
-    print(f"\nTotal contacts: {len(contacts)}\n")
-    
-    # Print contacts with formatting
-    for i, contact in enumerate(contacts, 1):
-        print(f"{i}. {contact['name']}")
-        print(f"   Phone: {contact['phone']}")
-        print(f"   Email: {contact['email']}")
-        print("-" * 50)
+    # Build the whole listing and write it out in one go
+    lines = [f"\nTotal contacts: {len(store)}\n"]
+    lines.extend(format_contacts(store, store.indices()))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def search_contact(contacts: List[Dict[str, str]]) -> None:
+def search_contact(store: ContactStore) -> None:
     """
     Search for a contact by name (case-insensitive, partial match).
     
     Args:
-        contacts: List of contacts to search
+        store: Contact store to search
     """
     print("\n--- Search Contact ---")
     
-    if not contacts:
+    if not len(store):
         print("No contacts available to search.")
         return
     
-    search_term = input("Enter name to search: ").strip().lower()
+    search_term = _input("Enter name to search: ").strip().casefold()
     
     if not search_term:
         print("❌ Search term cannot be empty.")
         return
     
     # Find all matching contacts (partial match)
-    matches = [c for c in contacts if search_term in c['name'].lower()]
+    matches = store.search(search_term)
     
     if not matches:
         print(f"No contacts found matching '{search_term}'.")
         return
     
-    print(f"\nFound {len(matches)} contact(s):\n")
-    for i, contact in enumerate(matches, 1):
-        print(f"{i}. {contact['name']}")
-        print(f"   Phone: {contact['phone']}")
-        print(f"   Email: {contact['email']}")
-        print("-" * 50)
+    lines = [f"\nFound {len(matches)} contact(s):\n"]
+    lines.extend(format_contacts(store, matches))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def edit_contact(contacts: List[Dict[str, str]]) -> None:
+def edit_contact(store: ContactStore) -> None:
     """
     Edit an existing contact's information.
     
     Args:
-        contacts: List of contacts
+        store: Contact store holding the contact
     """
     print("\n--- Edit Contact ---")
     
-    if not contacts:
+    if not len(store):
         print("No contacts available to edit.")
         return
     
-    name = input("Enter the name of the contact to edit: ").strip()
+    name = _input("Enter the name of the contact to edit: ").strip()
     
     if not name:
         print("❌ Name cannot be empty.")
         return
     
-    index = find_contact_index(contacts, name)
+    index = find_contact_index(store.name_index, name)
     
     if index is None:
         print(f"❌ Contact '{name}' not found.")
         return
     
-    contact = contacts[index]
-    print(f"\nEditing contact: {contact['name']}")
-    print(f"Current Phone: {contact['phone']}")
-    print(f"Current Email: {contact['email']}\n")
+    current_name, current_phone, current_email = store.get(index)
+    print(f"\nEditing contact: {current_name}")
+    print(f"Current Phone: {current_phone}")
+    print(f"Current Email: {current_email}\n")
     
     print("Leave blank to keep current value.")
     
     # Edit name
-    new_name = input(f"Enter new name [{contact['name']}]: ").strip()
+    new_name = _input(f"Enter new name [{current_name}]: ").strip()
     if new_name:
         # Check if new name already exists (and is different from current)
-        if new_name.lower() != contact['name'].lower() and contact_exists(contacts, new_name):
+        if new_name.lower() != store.names_lc[index] and contact_exists(store.name_index, new_name):
             print(f"❌ A contact with the name '{new_name}' already exists. Name not changed.")
-            new_name = contact['name']
+            new_name = current_name
     else:
-        new_name = contact['name']
+        new_name = current_name
     
     # Edit phone
     while True:
-        new_phone = input(f"Enter new phone [{contact['phone']}]: ").strip()
+        new_phone = _input(f"Enter new phone [{current_phone}]: ").strip()
         if not new_phone:
-            new_phone = contact['phone']
+            new_phone = current_phone
             break
         if validate_phone(new_phone):
             break
@@ -273,63 +618,54 @@ def edit_contact(contacts: List[Dict[str, str]]) -> None:
     
     # Edit email
     while True:
-        new_email = input(f"Enter new email [{contact['email']}]: ").strip()
+        new_email = _input(f"Enter new email [{current_email}]: ").strip()
         if not new_email:
-            new_email = contact['email']
+            new_email = current_email
             break
         if validate_email(new_email):
             break
         print("❌ Invalid email format. Please try again or leave blank to keep current.")
     
     # Update contact
-    contacts[index] = {
-        'name': new_name,
-        'phone': new_phone,
-        'email': new_email
-    }
-    
-    save_contacts(contacts)
+    store.update(index, new_name, new_phone, new_email)
     print(f"\n✓ Contact updated successfully!")
 
 
-def delete_contact(contacts: List[Dict[str, str]]) -> None:
+def delete_contact(store: ContactStore) -> None:
     """
     Delete a contact from the contact list.
     
     Args:
-        contacts: List of contacts
+        store: Contact store to delete from
     """
     print("\n--- Delete Contact ---")
     
-    if not contacts:
+    if not len(store):
         print("No contacts available to delete.")
         return
     
-    name = input("Enter the name of the contact to delete: ").strip()
+    name = _input("Enter the name of the contact to delete: ").strip()
     
     if not name:
         print("❌ Name cannot be empty.")
         return
     
-    index = find_contact_index(contacts, name)
+    index = find_contact_index(store.name_index, name)
     
     if index is None:
         print(f"❌ Contact '{name}' not found.")
         return
     
-    contact = contacts[index]
-    
     # Confirmation before deletion
     print(f"\nContact to delete:")
-    print(f"Name: {contact['name']}")
-    print(f"Phone: {contact['phone']}")
-    print(f"Email: {contact['email']}\n")
+    print(f"Name: {store.names[index]}")
+    print(f"Phone: {store.phones[index]}")
+    print(f"Email: {store.emails[index]}\n")
     
-    confirm = input("Are you sure you want to delete this contact? (y/n): ").strip().lower()
+    confirm = _input("Are you sure you want to delete this contact? (y/n): ").strip().lower()
     
     if confirm == 'y':
-        contacts.pop(index)
-        save_contacts(contacts)
+        store.remove(index)
         print(f"\n✓ Contact '{name}' deleted successfully!")
     else:
         print("Deletion cancelled.")
@@ -356,41 +692,49 @@ def get_menu_choice() -> str:
     Returns:
         User's menu choice as a string
     """
-    choice = input("Enter your choice (1-6): ").strip()
+    choice = _input("Enter your choice (1-6): ").strip()
     return choice
 
 
+# Menu choices mapped to the function handling them (6 exits the loop)
+MENU_ACTIONS = {
+    '1': add_contact,
+    '2': view_all_contacts,
+    '3': search_contact,
+    '4': edit_contact,
+    '5': delete_contact,
+}
+
+
 def main():
     """Main function to run the contact management system."""
     # Load existing contacts
-    contacts = load_contacts()
+    store = ContactStore(load_contacts())
     
     print("\n🌟 Welcome to the Contact Management System! 🌟")
     
-    # Main program loop
-    while True:
-        display_menu()
-        choice = get_menu_choice()
-        
-        if choice == '1':
-            add_contact(contacts)
-        elif choice == '2':
-            view_all_contacts(contacts)
-        elif choice == '3':
-            search_contact(contacts)
-        elif choice == '4':
-            edit_contact(contacts)
-        elif choice == '5':
-            delete_contact(contacts)
-        elif choice == '6':
-            print("\n👋 Thank you for using the Contact Management System!")
-            print("Goodbye!\n")
-            break
-        else:
-            print("\n❌ Invalid choice. Please enter a number between 1 and 6.")
-        
-        # Pause before showing menu again
-        input("\nPress Enter to continue...")
+    # Main program loop; pending changes are written out however it ends
+    try:
+        while True:
+            display_menu()
+            choice = get_menu_choice()
+            
+            if choice == '6':
+                store.save()
+                print("\n👋 Thank you for using the Contact Management System!")
+                print("Goodbye!\n")
+                break
+            
+            action = MENU_ACTIONS.get(choice)
+            if action is not None:
+                action(store)
+            else:
+                print("\n❌ Invalid choice. Please enter a number between 1 and 6.")
+            
+            # Pause before showing menu again
+            _input("\nPress Enter to continue...")
+    finally:
+        store.save()
 
 
 if __name__ == "__main__":
@@ -1,19 +1,176 @@
 """
 Sudoku Solver using Backtracking Algorithm
 ==========================================
-This program solves 9x9 Sudoku puzzles using recursive backtracking.
+This program solves 9x9 Sudoku puzzles using backtracking search.
 It validates placements and finds solutions efficiently.
+
+The pure-Python solver is used by default. SudokuSolver(native=True) runs
+the search in a compiled Numba kernel instead, if NumPy and Numba are
+installed; they are only imported then, since their import and JIT time
+outweigh the search itself for typical puzzles.
 """
 
+# NumPy is imported by _load_native() when the compiled kernel is requested
+np = None
+_native_ready = False
+
+
+# Row, column and 3x3 box of each of the 81 cells (row-major), so the
+# solver's lookups avoid divisions
+ROW = bytes(i // 9 for i in range(81))
+COL = bytes(i % 9 for i in range(81))
+BOX = bytes((r // 3) * 3 + c // 3 for r in range(9) for c in range(9))
+
+# Mask with bits 1-9 set, one per possible digit
+ALL_DIGITS = 0x3FE
+
+# Byte translation table mapping the ASCII digits '0'-'9' to the values 0-9
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+# Search kernels in NumPy terms; _load_native() compiles them with Numba
+def _pick_cell_nb(board, rows, cols, boxes):
+    """
+    Find the empty cell with the fewest candidates (compiled).
+    
+    Returns:
+        tuple: (cell index 0-80 or -1 if board is full, candidate mask)
+    """
+    best = -1
+    best_cand = 0
+    best_count = 10
+    for i in range(9):
+        for j in range(9):
+            if board[i, j] == 0:
+                used = rows[i] | cols[j] | boxes[(i // 3) * 3 + j // 3]
+                cand = ~used & ALL_DIGITS
+                
+                # Count the set bits of the candidate mask
+                count = 0
+                m = cand
+                while m:
+                    m &= m - 1
+                    count += 1
+                
+                if count < best_count:
+                    best = i * 9 + j
+                    best_cand = cand
+                    best_count = count
+                    if count <= 1:
+                        return best, best_cand
+    return best, best_cand
+
+def _solve_nb(board, rows, cols, boxes):
+    """
+    Solve the board in place with bitmask backtracking (compiled).
+    
+    Uses an explicit stack of (cell, remaining candidates) instead of
+    recursion. The call count matches what the recursive solver reports.
+    
+    Args:
+        board: int8[9, 9] array, 0 for empty cells
+        rows, cols, boxes: int64[9] digit masks for the board
+    
+    Returns:
+        tuple: (True if solved, number of search steps)
+    """
+    cells = np.empty(81, dtype=np.int64)
+    cands = np.empty(81, dtype=np.int64)
+    calls = 1
+    
+    cell, cand = _pick_cell_nb(board, rows, cols, boxes)
+    if cell < 0:
+        return True, calls
+    
+    depth = 0
+    cells[0] = cell
+    cands[0] = cand
+    while depth >= 0:
+        cell = cells[depth]
+        r = cell // 9
+        c = cell % 9
+        b = (r // 3) * 3 + c // 3
+        
+        # Undo the digit previously tried in this cell, if any
+        num = board[r, c]
+        if num:
+            bit = np.int64(1) << np.int64(num)
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            board[r, c] = 0
+        
+        cand = cands[depth]
+        if cand == 0:
+            # No candidates left: backtrack to the previous cell
+            depth -= 1
+            continue
+        
+        # Take the lowest remaining candidate
+        bit = cand & -cand
+        cands[depth] = cand ^ bit
+        num = 0
+        while (bit >> num) > 1:
+            num += 1
+        
+        rows[r] ^= bit
+        cols[c] ^= bit
+        boxes[b] ^= bit
+        board[r, c] = num
+        calls += 1
+        
+        cell, cand = _pick_cell_nb(board, rows, cols, boxes)
+        if cell < 0:
+            return True, calls
+        depth += 1
+        cells[depth] = cell
+        cands[depth] = cand
+    
+    return False, calls
+
+
+def _load_native():
+    """
+    Import NumPy and Numba and compile the search kernels, on first use.
+    
+    Returns:
+        bool: True if the compiled kernels are available
+    """
+    global np, _pick_cell_nb, _solve_nb, _native_ready
+    if _native_ready:
+        return True
+    try:
+        import numpy as np
+        import numba
+    except ImportError:
+        return False
+    
+    _pick_cell_nb = numba.njit(cache=True)(_pick_cell_nb)
+    _solve_nb = numba.njit(cache=True)(_solve_nb)
+    _native_ready = True
+    return True
+
 
 class SudokuSolver:
     """
     A class to solve Sudoku puzzles using backtracking algorithm.
     """
     
-    def __init__(self):
-        """Initialize the solver with a recursion counter."""
+    def __init__(self, native=False):
+        """
+        Initialize the solver with a recursion counter and digit masks.
+        
+        Args:
+            native (bool): Search with the compiled Numba kernel when NumPy
+                and Numba are installed (falls back to pure Python if not)
+        """
+        self.native = native
         self.recursion_count = 0
+        
+        # Bit k of each mask is set when digit k is used in that row/col/box
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
     
     def print_board(self, board):
         """
@@ -41,105 +198,181 @@ class SudokuSolver:
             print(row_str)
         print("=" * 37 + "\n")
     
-    def is_valid(self, board, row, col, num):
+    def _prepare(self, cells):
+        """
+        Build the row, column and box digit masks from the given cells.
+        
+        Args:
+            cells (bytearray): The 81 board cells in row-major order
+        """
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        
+        for idx, num in enumerate(cells):
+            if num:
+                bit = 1 << num
+                self.rows[ROW[idx]] |= bit
+                self.cols[COL[idx]] |= bit
+                self.boxes[BOX[idx]] |= bit
+    
+    def is_valid(self, idx, num):
         """
         Check if placing a number in a specific position is valid.
         
         Args:
-            board (list): 9x9 2D list representing the Sudoku grid
-            row (int): Row index (0-8)
-            col (int): Column index (0-8)
+            idx (int): Cell index (0-80, row-major)
             num (int): Number to place (1-9)
         
         Returns:
             bool: True if placement is valid, False otherwise
         """
-        # Check if num already exists in the row
-        for j in range(9):
-            if board[row][j] == num:
-                return False
-        
-        # Check if num already exists in the column
-        for i in range(9):
-            if board[i][col] == num:
-                return False
-        
-        # Check if num already exists in the 3x3 subgrid
-        # Find the top-left corner of the 3x3 box
-        box_row = (row // 3) * 3
-        box_col = (col // 3) * 3
+        # The number is valid only if it is unused in the row, column and box
+        used = self.rows[ROW[idx]] | self.cols[COL[idx]] | self.boxes[BOX[idx]]
+        return not (used & (1 << num))
+    
+    def candidates(self, idx):
+        """
+        Get the digits that can still be placed in a cell.
         
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if board[i][j] == num:
-                    return False
+        Args:
+            idx (int): Cell index (0-80, row-major)
         
-        # If all checks pass, the placement is valid
-        return True
+        Returns:
+            int: Bitmask with bit k set for every legal digit k
+        """
+        used = self.rows[ROW[idx]] | self.cols[COL[idx]] | self.boxes[BOX[idx]]
+        return ~used & ALL_DIGITS
     
-    def find_empty_cell(self, board):
+    def find_empty_cell(self, cells):
         """
-        Find the next empty cell (containing 0) in the board.
+        Find the empty cell (containing 0) with the fewest legal candidates.
+        
+        Picking the most constrained cell first keeps the search tree small.
         
         Args:
-            board (list): 9x9 2D list representing the Sudoku grid
+            cells (bytearray): The 81 board cells in row-major order
         
         Returns:
-            tuple: (row, col) of empty cell, or None if board is full
+            int: Index of the empty cell, or None if board is full
         """
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == 0:
-                    return (i, j)
-        return None
+        best = None
+        best_count = 10
+        
+        # bytearray.find skips over the filled cells in C
+        idx = cells.find(0)
+        while idx != -1:
+            count = self.candidates(idx).bit_count()
+            if count < best_count:
+                best = idx
+                best_count = count
+                # A cell with one or no candidates cannot be beaten
+                if count <= 1:
+                    return best
+            idx = cells.find(0, idx + 1)
+        return best
     
-    def solve(self, board):
+    def solve(self, cells):
         """
         Solve the Sudoku puzzle using backtracking algorithm.
         
         Algorithm:
-        1. Find an empty cell
-        2. Try numbers 1-9 in that cell
-        3. For each number, check if it's valid
-        4. If valid, place it and recursively try to solve rest
-        5. If solving fails, backtrack (remove number and try next)
-        6. If no number works, return False to trigger backtracking
+        1. Find the most constrained empty cell
+        2. Try each number that is still legal in that cell
+        3. Place it and move on to the next empty cell
+        4. If a cell runs out of numbers, backtrack (remove the number
+           from the previous cell and try its next one)
+        5. If the first cell runs out of numbers, no solution exists
+        
+        The search keeps an explicit stack of [cell, remaining candidates]
+        entries instead of recursing, which avoids a Python call per step.
+        recursion_count still counts one step per placement plus the
+        initial call, as the recursive version did.
         
         Args:
-            board (list): 9x9 2D list representing the Sudoku grid
+            cells (bytearray): The 81 board cells in row-major order,
+                with masks already built by _prepare
         
         Returns:
             bool: True if puzzle is solved, False if no solution exists
         """
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        
         # Increment recursion counter for statistics
         self.recursion_count += 1
         
-        # Find the next empty cell
-        empty_cell = self.find_empty_cell(board)
-        
-        # If no empty cell exists, puzzle is solved
-        if empty_cell is None:
+        # Find the first empty cell; if there is none the puzzle is solved
+        idx = self.find_empty_cell(cells)
+        if idx is None:
             return True
         
-        row, col = empty_cell
-        
-        # Try numbers 1 through 9
-        for num in range(1, 10):
-            # Check if this number is valid in this position
-            if self.is_valid(board, row, col, num):
-                # Place the number (make a choice)
-                board[row][col] = num
-                
-                # Recursively attempt to solve with this number placed
-                if self.solve(board):
-                    return True
-                
-                # If recursion failed, backtrack (undo the choice)
-                board[row][col] = 0
+        stack = [[idx, self.candidates(idx)]]
+        while stack:
+            entry = stack[-1]
+            idx, cand = entry
+            row = ROW[idx]
+            col = COL[idx]
+            box = BOX[idx]
+            
+            # Backtrack: undo the number previously tried in this cell
+            num = cells[idx]
+            if num:
+                bit = 1 << num
+                rows[row] ^= bit
+                cols[col] ^= bit
+                boxes[box] ^= bit
+                cells[idx] = 0
+            
+            # If no number works here, return to the previous cell
+            if not cand:
+                stack.pop()
+                continue
+            
+            # Take the lowest remaining candidate
+            bit = cand & -cand
+            entry[1] = cand ^ bit
+            
+            # Place the number (make a choice)
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+            cells[idx] = bit.bit_length() - 1
+            self.recursion_count += 1
+            
+            # Move on to the next empty cell, or stop if the board is full
+            idx = self.find_empty_cell(cells)
+            if idx is None:
+                return True
+            stack.append([idx, self.candidates(idx)])
         
-        # If no number works, trigger backtracking
         return False
     
+    def solve_native(self, board):
+        """
+        Solve the puzzle with the compiled Numba kernel.
+        
+        The board is copied into a NumPy array, solved there, and the
+        result is written back into the given list.
+        
+        Args:
+            board (list): 9x9 2D list representing the Sudoku grid
+        
+        Returns:
+            bool: True if puzzle is solved, False if no solution exists
+        """
+        grid = np.asarray(board, dtype=np.int8)
+        rows = np.asarray(self.rows, dtype=np.int64)
+        cols = np.asarray(self.cols, dtype=np.int64)
+        boxes = np.asarray(self.boxes, dtype=np.int64)
+        
+        solved, calls = _solve_nb(grid, rows, cols, boxes)
+        self.recursion_count += calls
+        
+        if solved:
+            for i in range(9):
+                board[i][:] = grid[i].tolist()
+        return solved
+    
     def solve_sudoku(self, board):
         """
         Main method to solve Sudoku and display results.
@@ -150,13 +383,23 @@ class SudokuSolver:
         print("Original Sudoku Puzzle:")
         self.print_board(board)
         
-        # Reset recursion counter
+        # Reset recursion counter and build the digit masks
         self.recursion_count = 0
+        cells = bytearray(num for row in board for num in row)
+        self._prepare(cells)
         
         print("Solving...")
         
-        # Attempt to solve the puzzle
-        if self.solve(board):
+        # Attempt to solve the puzzle, using the compiled kernel if requested
+        if self.native and _load_native():
+            solved = self.solve_native(board)
+        else:
+            solved = self.solve(cells)
+            if solved:
+                for i in range(9):
+                    board[i][:] = cells[i * 9:i * 9 + 9]
+        
+        if solved:
             print("✓ Solution Found!\n")
             print("Solved Sudoku Puzzle:")
             self.print_board(board)
@@ -185,7 +428,15 @@ def get_user_input():
         while True:
             try:
                 row_input = input(f"Row {i + 1}: ").strip()
-                row = [int(x) for x in row_input.split()]
+                tokens = row_input.split()
+                
+                # Fast path: nine single ASCII digits convert in one C call
+                digits = "".join(tokens)
+                if len(tokens) == 9 and len(digits) == 9 and digits.isascii() and digits.isdigit():
+                    board.append(list(digits.encode("ascii").translate(DIGIT_VALUES)))
+                    break
+                
+                row = [int(x) for x in tokens]
                 
                 # Validate row length
                 if len(row) != 9:
@@ -3,33 +3,84 @@ Temperature Conversion Program
 Converts temperatures between Celsius, Fahrenheit, and Kelvin
 """
 
+import sys
+from typing import NamedTuple, Optional
+
+# NumPy is only needed for converting whole arrays of temperatures
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Conversion constants, precomputed so conversions multiply instead of divide
+F_SCALE = 9.0 / 5.0
+F_INV = 5.0 / 9.0
+F_OFFSET = 32.0
+K_OFFSET = 273.15
+
+class Conversion(NamedTuple):
+    """
+    Result of a temperature conversion
+    
+    The field for the unit that was converted from is None.
+    """
+    original: str
+    celsius: Optional[float]
+    fahrenheit: Optional[float]
+    kelvin: Optional[float]
+
 def celsius_to_fahrenheit(celsius):
     """
     Convert Celsius to Fahrenheit
     Formula: (C × 9/5) + 32
     """
-    return (celsius * 9/5) + 32
+    return celsius * F_SCALE + F_OFFSET
 
 def celsius_to_kelvin(celsius):
     """
     Convert Celsius to Kelvin
     Formula: C + 273.15
     """
-    return celsius + 273.15
+    return celsius + K_OFFSET
 
 def fahrenheit_to_celsius(fahrenheit):
     """
     Convert Fahrenheit to Celsius
     Formula: (F − 32) × 5/9
     """
-    return (fahrenheit - 32) * 5/9
+    return (fahrenheit - F_OFFSET) * F_INV
 
 def kelvin_to_celsius(kelvin):
     """
     Convert Kelvin to Celsius
     Formula: K − 273.15
     """
-    return kelvin - 273.15
+    return kelvin - K_OFFSET
+
+def _from_c(value):
+    """Convert a Celsius value to the other two units"""
+    fahrenheit = celsius_to_fahrenheit(value)
+    kelvin = celsius_to_kelvin(value)
+    return Conversion(f"{value}°C", None, fahrenheit, kelvin)
+
+def _from_f(value):
+    """Convert a Fahrenheit value to the other two units"""
+    celsius = fahrenheit_to_celsius(value)
+    kelvin = celsius_to_kelvin(celsius)
+    return Conversion(f"{value}°F", celsius, None, kelvin)
+
+def _from_k(value):
+    """Convert a Kelvin value to the other two units"""
+    celsius = kelvin_to_celsius(value)
+    fahrenheit = celsius_to_fahrenheit(celsius)
+    return Conversion(f"{value} K", celsius, fahrenheit, None)
+
+# Absolute zero, its error message and the converter for each input unit
+_DISPATCH = {
+    'C': (-273.15, "Error: Temperature cannot be below absolute zero (-273.15°C)", _from_c),
+    'F': (-459.67, "Error: Temperature cannot be below absolute zero (-459.67°F)", _from_f),
+    'K': (0.0, "Error: Kelvin cannot be negative (absolute zero is 0 K)", _from_k)
+}
 
 def convert_temperature(value, unit):
     """
@@ -40,73 +91,109 @@ def convert_temperature(value, unit):
         unit: Original unit ('C', 'F', or 'K')
     
     Returns:
-        Dictionary with converted values or None if invalid
+        Conversion with the converted values or None if invalid
     """
     unit = unit.upper()
+    entry = _DISPATCH.get(unit)
+    if entry is None:
+        print(f"Error: Invalid unit '{unit}'. Please use C, F, or K.")
+        return None
     
     # Validate physical limits
-    if unit == 'K' and value < 0:
-        print("Error: Kelvin cannot be negative (absolute zero is 0 K)")
+    floor, error, convert = entry
+    if value < floor:
+        print(error)
         return None
-    elif unit == 'C' and value < -273.15:
-        print("Error: Temperature cannot be below absolute zero (-273.15°C)")
+    
+    return convert(value)
+
+def convert_temperature_array(values, unit):
+    """
+    Convert an array of temperatures from one unit to the other two units
+    
+    Each conversion is a single vectorized NumPy expression, so large
+    batches avoid per-value Python overhead. Requires NumPy.
+    
+    Args:
+        values: Temperature values (array-like of floats)
+        unit: Original unit ('C', 'F', or 'K')
+    
+    Returns:
+        Dictionary mapping the other two unit names to arrays of converted
+        values, or None if invalid
+    """
+    if np is None:
+        raise ImportError("convert_temperature_array requires NumPy")
+    
+    values = np.asarray(values, dtype=np.float64)
+    unit = unit.upper()
+    
+    entry = _DISPATCH.get(unit)
+    if entry is None:
+        print(f"Error: Invalid unit '{unit}'. Please use C, F, or K.")
         return None
-    elif unit == 'F' and value < -459.67:
-        print("Error: Temperature cannot be below absolute zero (-459.67°F)")
+    
+    # Validate physical limits once for the whole array
+    floor, error, _ = entry
+    if np.any(values < floor):
+        print(error)
         return None
     
-    # Perform conversions based on input unit
     if unit == 'C':
-        fahrenheit = celsius_to_fahrenheit(value)
-        kelvin = celsius_to_kelvin(value)
         return {
-            'original': f"{value}°C",
-            'fahrenheit': fahrenheit,
-            'kelvin': kelvin
+            'fahrenheit': values * F_SCALE + F_OFFSET,
+            'kelvin': values + K_OFFSET
         }
     
     elif unit == 'F':
-        celsius = fahrenheit_to_celsius(value)
-        kelvin = celsius_to_kelvin(celsius)
+        celsius = (values - F_OFFSET) * F_INV
         return {
-            'original': f"{value}°F",
             'celsius': celsius,
-            'kelvin': kelvin
+            'kelvin': celsius + K_OFFSET
         }
     
-    elif unit == 'K':
-        celsius = kelvin_to_celsius(value)
-        fahrenheit = celsius_to_fahrenheit(celsius)
+    else:
+        celsius = values - K_OFFSET
         return {
-            'original': f"{value} K",
             'celsius': celsius,
-            'fahrenheit': fahrenheit
+            'fahrenheit': celsius * F_SCALE + F_OFFSET
         }
-    
-    else:
-        print(f"Error: Invalid unit '{unit}'. Please use C, F, or K.")
-        return None
+
+# Unit names in Conversion field order, and the display format for each
+_UNITS = ('celsius', 'fahrenheit', 'kelvin')
+_FMT = {
+    'celsius': "Celsius: {:.2f}°C",
+    'fahrenheit': "Fahrenheit: {:.2f}°F",
+    'kelvin': "Kelvin: {:.2f} K"
+}
+
+# Accepted answers for the unit prompt and the "convert another" prompt
+_VALID_UNITS = frozenset({'C', 'F', 'K'})
+_YES = frozenset({'y', 'yes'})
 
 def display_results(results):
     """
     Display conversion results in a formatted way
     """
-    print("\n" + "="*40)
-    print("CONVERSION RESULTS")
-    print("="*40)
-    print(f"Original Temperature: {results['original']}")
-    print("-"*40)
+    out = [
+        "\n" + "="*40,
+        "CONVERSION RESULTS",
+        "="*40,
+        f"Original Temperature: {results.original}",
+        "-"*40,
+    ]
     
     # Display other two units
-    for key, value in results.items():
-        if key != 'original':
-            if key == 'celsius':
-                print(f"Celsius: {value:.2f}°C")
-            elif key == 'fahrenheit':
-                print(f"Fahrenheit: {value:.2f}°F")
-            elif key == 'kelvin':
-                print(f"Kelvin: {value:.2f} K")
-    print("="*40 + "\n")
+    values = (results.celsius, results.fahrenheit, results.kelvin)
+    out.extend(
+        _FMT[key].format(value)
+        for key, value in zip(_UNITS, values)
+        if value is not None
+    )
+    out.append("="*40 + "\n")
+    
+    # One write for the whole block instead of a print() per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """
@@ -116,41 +203,45 @@ def main():
     print("TEMPERATURE CONVERSION PROGRAM")
     print("="*40)
     
-    # Get temperature value
     while True:
-        try:
-            temp_value = float(input("\nEnter temperature value: "))
-            break
-        except ValueError:
-            print("Error: Please enter a valid numeric value.")
-    
-    # Get unit of measurement
-    print("\nChoose unit:")
-    print("  C - Celsius")
-    print("  F - Fahrenheit")
-    print("  K - Kelvin")
-    
-    while True:
-        unit = input("\nEnter unit (C/F/K): ").strip().upper()
-        if unit in ['C', 'F', 'K']:
+        # Get temperature value
+        while True:
+            try:
+                temp_value = float(input("\nEnter temperature value: "))
+                break
+            except ValueError:
+                print("Error: Please enter a valid numeric value.")
+        
+        # Get unit of measurement
+        print("\nChoose unit:")
+        print("  C - Celsius")
+        print("  F - Fahrenheit")
+        print("  K - Kelvin")
+        
+        while True:
+            unit = input("\nEnter unit (C/F/K): ").strip().upper()
+            if unit in _VALID_UNITS:
+                break
+            else:
+                print("Error: Please enter C, F, or K.")
+        
+        # Perform conversion
+        results = convert_temperature(temp_value, unit)
+        
+        # Stop if the conversion failed
+        if not results:
             break
-        else:
-            print("Error: Please enter C, F, or K.")
-    
-    # Perform conversion
-    results = convert_temperature(temp_value, unit)
-    
-    # Display results if conversion was successful
-    if results:
+        
         display_results(results)
         
         # Ask if user wants to convert another temperature
         another = input("Convert another temperature? (y/n): ").strip().lower()
-        if another == 'y':
+        if another in _YES:
             print("\n")
-            main()  # Recursive call to start over
-        else:
-            print("\nThank you for using the Temperature Conversion Program!")
+            continue
+        
+        print("\nThank you for using the Temperature Conversion Program!")
+        break
 
 # Run the program
 if __name__ == "__main__":
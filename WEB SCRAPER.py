@@ -8,42 +8,257 @@ Date: 2026
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
 import csv
-import time
-from typing import List, Dict, Optional
+from array import array
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+# Prefer the C-based lxml parser, falling back to the stdlib one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
-def fetch_page(url: str, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+# selectolax is a much faster native HTML parser; BeautifulSoup is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        # selectolax < 0.3 only ships the Modest backend
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+# NumPy is only needed for the rating and price summary
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# httpx fetches all pages from one event loop; requests threads are the fallback
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 (one multiplexed connection) is only available with the h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+
+# Default request headers; the user-agent mimics a real browser
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# A scraped product as a (name, price, rating) row, and the CSV column names
+Product = Tuple[str, str, str]
+CSV_HEADERS = ('Name', 'Price', 'Rating')
+
+# Maximum number of pages fetched at the same time
+MAX_WORKERS = 8
+
+# Number of products shown in the sample display
+SAMPLE_SIZE = 5
+
+# Rating words used in the star-rating class, and their numeric values
+_RATING_MAP = {
+    'One': '1',
+    'Two': '2',
+    'Three': '3',
+    'Four': '4',
+    'Five': '5'
+}
+# Numeric rating for each parsed rating string; 0 marks a missing rating
+_RATING_INT = {value: int(value) for value in _RATING_MAP.values()}
+_RATING_INT['N/A'] = 0
+_RATING_RE = re.compile(r'\b(One|Two|Three|Four|Five)\b')
+
+# Only build the product containers, not the rest of the page
+PRODUCT_STRAINER = SoupStrainer('article', class_='product_pod')
+
+# Connection pool size per host; comfortably above MAX_WORKERS
+POOL_SIZE = 16
+
+# Retry policy for transient gateway errors, shared by requests and httpx
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
+
+def _make_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all fetches.
+    
+    Connections (and TLS sessions) are pooled and reused across pages, and
+    transient gateway errors are retried by urllib3 with a short backoff.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF,
+                          status_forcelist=RETRY_STATUSES)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+
+def fetch_page(url: str, headers: Optional[Dict[str, str]] = None, *,
+               session: Optional[requests.Session] = None) -> Optional[str]:
     """
     Fetch the HTML content of a webpage.
     
     Args:
         url: The URL to fetch
-        headers: Optional HTTP headers to include in the request
+        headers: Optional HTTP headers to add to the session's headers
+        session: Session to send the request with (defaults to the shared one)
     
     Returns:
         HTML content as a string, or None if the request fails
     """
     try:
-        # Add user-agent to mimic a real browser
-        if headers is None:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                              '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+        if session is None:
+            session = _SESSION
         
         print(f"Fetching: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
+        response = session.get(url, headers=headers, timeout=10)
         response.raise_for_status()  # Raise an exception for bad status codes
         
-        return response.text
+        # The catalogue is UTF-8; decoding it directly skips requests'
+        # charset detection (and the mis-guessed ISO-8859-1 default)
+        return response.content.decode('utf-8', 'replace')
     
     except requests.exceptions.RequestException as e:
         print(f"Error fetching {url}: {e}")
         return None
 
 
+async def _fetch_page_async(client: 'httpx.AsyncClient', url: str) -> Optional[str]:
+    """
+    Fetch the HTML content of a webpage with an async httpx client.
+    
+    Gateway errors (RETRY_STATUSES) are retried up to RETRY_TOTAL times
+    with exponential backoff, matching the requests session's policy.
+    
+    Args:
+        client: The shared async client
+        url: The URL to fetch
+    
+    Returns:
+        HTML content as a string, or None if the request fails
+    """
+    try:
+        print(f"Fetching: {url}")
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await client.get(url)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                break
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        response.raise_for_status()  # Raise an exception for bad status codes
+        
+        return response.content.decode('utf-8', 'replace')
+    
+    except httpx.HTTPError as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+
+def _fetch_pages_httpx(urls: List[str], max_workers: int) -> Iterator[Optional[str]]:
+    """
+    Fetch several pages concurrently with httpx on an event loop of our own.
+    
+    All requests are started at once; the loop is then run until each page
+    in turn has arrived, so every page is handed over as soon as it and the
+    pages before it are in, while the later ones keep downloading.
+    
+    Args:
+        urls: The URLs to fetch
+        max_workers: Maximum number of connections open at the same time
+    
+    Yields:
+        HTML content for each URL in order (None for pages that failed)
+    """
+    loop = asyncio.new_event_loop()
+    limits = httpx.Limits(max_connections=max_workers)
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2, limits=limits, retries=RETRY_TOTAL)
+    client = httpx.AsyncClient(headers=DEFAULT_HEADERS, timeout=10, transport=transport)
+    tasks = [loop.create_task(_fetch_page_async(client, url)) for url in urls]
+    try:
+        for task in tasks:
+            yield loop.run_until_complete(task)
+    finally:
+        # Stop pages nobody will read (the caller may stop early)
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(client.aclose())
+        loop.close()
+
+
+def _event_loop_running() -> bool:
+    """
+    Check whether an asyncio event loop is running in this thread.
+    
+    Returns:
+        True if called from inside a running event loop, False otherwise
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def fetch_pages(urls: List[str], max_workers: int = MAX_WORKERS) -> Iterator[Optional[str]]:
+    """
+    Fetch several pages concurrently.
+    
+    Uses httpx on a single event loop when it is installed, otherwise a
+    thread pool over the shared requests session. The thread pool is also
+    used when called from a running event loop (e.g. Jupyter), which cannot
+    run another loop in the same thread. Either way, each page is yielded as
+    soon as it and the pages before it have arrived.
+    
+    Args:
+        urls: The URLs to fetch
+        max_workers: Maximum number of pages fetched at the same time
+    
+    Yields:
+        HTML content for each URL in order (None for pages that failed)
+    """
+    if not urls:
+        return
+    
+    if httpx is not None and not _event_loop_running():
+        yield from _fetch_pages_httpx(urls, max_workers)
+        return
+    
+    # The bounded pool keeps the load polite
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        yield from executor.map(fetch_page, urls)
+
+
 def parse_rating(rating_class: str) -> str:
     """
     Convert rating class name to numeric rating.
@@ -54,172 +269,302 @@ def parse_rating(rating_class: str) -> str:
     Returns:
         Numeric rating as a string (e.g., '3')
     """
-    rating_map = {
-        'One': '1',
-        'Two': '2',
-        'Three': '3',
-        'Four': '4',
-        'Five': '5'
-    }
-    
     # Extract the rating word from the class
-    for word in rating_class.split():
-        if word in rating_map:
-            return rating_map[word]
+    match = _RATING_RE.search(rating_class)
+    return _RATING_MAP[match.group(1)] if match else 'N/A'
+
+
+def parse_price(price: str) -> float:
+    """
+    Convert a price string to a number.
+    
+    Args:
+        price: The displayed price (e.g., '£51.77')
+    
+    Returns:
+        Price as a float, or NaN if it is missing or invalid
+    """
+    try:
+        return float(price.lstrip('£'))
+    except ValueError:
+        return float('nan')
+
+
+def _parse_products_selectolax(html_content: str) -> Iterator[Product]:
+    """
+    Parse product information with selectolax.
     
-    return 'N/A'
+    Args:
+        html_content: HTML content as a string
+    
+    Yields:
+        (name, price, rating) tuples
+    """
+    tree = HTMLParser(html_content)
+    
+    for product in tree.css('article.product_pod'):
+        try:
+            # Extract product name
+            name_tag = product.css_first('h3 a')
+            name = name_tag.attributes.get('title', 'N/A') if name_tag else 'N/A'
+            
+            # Extract price
+            price_tag = product.css_first('p.price_color')
+            price = price_tag.text().strip() if price_tag else 'N/A'
+            
+            # Extract rating
+            rating_tag = product.css_first('p.star-rating')
+            if rating_tag:
+                rating = parse_rating(rating_tag.attributes.get('class') or '')
+            else:
+                rating = 'N/A'
+            
+        except Exception as e:
+            print(f"Error parsing individual product: {e}")
+            continue
+        
+        yield (name, price, rating)
 
 
-def parse_products(html_content: str) -> List[Dict[str, str]]:
+def _parse_products_bs4(html_content: str) -> Iterator[Product]:
+    """
+    Parse product information with BeautifulSoup.
+    
+    Args:
+        html_content: HTML content as a string
+    
+    Yields:
+        (name, price, rating) tuples
+    """
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=PRODUCT_STRAINER)
+    
+    # Find all product containers
+    product_containers = soup.find_all('article', class_='product_pod')
+    
+    for product in product_containers:
+        try:
+            # Extract product name
+            name_tag = product.h3.a
+            name = name_tag.get('title', 'N/A') if name_tag else 'N/A'
+            
+            # Extract price
+            price_tag = product.find('p', class_='price_color')
+            price = price_tag.text.strip() if price_tag else 'N/A'
+            
+            # Extract rating
+            rating_tag = product.find('p', class_='star-rating')
+            if rating_tag:
+                # bs4 already splits the class attribute into a list
+                rating = next((_RATING_MAP[c] for c in rating_tag.get('class', ())
+                               if c in _RATING_MAP), 'N/A')
+            else:
+                rating = 'N/A'
+            
+        except Exception as e:
+            print(f"Error parsing individual product: {e}")
+            continue
+        
+        yield (name, price, rating)
+
+
+def parse_products(html_content: str) -> Iterator[Product]:
     """
     Parse product information from HTML content.
     
+    Uses selectolax when it is installed, otherwise BeautifulSoup.
+    
     Args:
         html_content: HTML content as a string
     
-    Returns:
-        List of dictionaries containing product information
+    Yields:
+        (name, price, rating) tuples
     """
-    products = []
+    parsed = 0
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find all product containers
-        product_containers = soup.find_all('article', class_='product_pod')
+        if HTMLParser is not None:
+            products = _parse_products_selectolax(html_content)
+        else:
+            products = _parse_products_bs4(html_content)
         
-        for product in product_containers:
-            try:
-                # Extract product name
-                name_tag = product.find('h3').find('a')
-                name = name_tag.get('title', 'N/A') if name_tag else 'N/A'
-                
-                # Extract price
-                price_tag = product.find('p', class_='price_color')
-                price = price_tag.text.strip() if price_tag else 'N/A'
-                
-                # Extract rating
-                rating_tag = product.find('p', class_='star-rating')
-                if rating_tag:
-                    rating_class = rating_tag.get('class', [])
-                    rating = parse_rating(' '.join(rating_class))
-                else:
-                    rating = 'N/A'
-                
-                # Add product to list
-                products.append({
-                    'Name': name,
-                    'Price': price,
-                    'Rating': rating
-                })
-                
-            except Exception as e:
-                print(f"Error parsing individual product: {e}")
-                continue
+        for product in products:
+            parsed += 1
+            yield product
         
-        print(f"Parsed {len(products)} products from this page")
+        print(f"Parsed {parsed} products from this page")
         
     except Exception as e:
         print(f"Error parsing HTML content: {e}")
-    
-    return products
 
 
-def scrape_multiple_pages(base_url: str, num_pages: int = 3) -> List[Dict[str, str]]:
+def scrape_multiple_pages(base_url: str, num_pages: int = 3,
+                          max_workers: int = MAX_WORKERS) -> Iterator[Product]:
     """
     Scrape products from multiple pages.
     
+    Pages are fetched concurrently (see fetch_pages). Products are yielded
+    page by page, in page order, so callers can process them as they come.
+    
     Args:
         base_url: The base URL of the website
         num_pages: Number of pages to scrape
+        max_workers: Maximum number of pages fetched at the same time
     
-    Returns:
-        List of all scraped products
+    Yields:
+        (name, price, rating) tuples
     """
-    all_products = []
+    # Construct URL for each page
+    urls = [
+        base_url if page_num == 1
+        else f"{base_url.rstrip('/')}/catalogue/page-{page_num}.html"
+        for page_num in range(1, num_pages + 1)
+    ]
     
-    for page_num in range(1, num_pages + 1):
-        # Construct URL for each page
-        if page_num == 1:
-            url = base_url
-        else:
-            url = f"{base_url.rstrip('/')}/catalogue/page-{page_num}.html"
-        
-        # Fetch and parse the page
-        html_content = fetch_page(url)
-        
+    # Fetch all pages in parallel, then parse them in order, stopping at the
+    # first one that failed
+    for page_num, html_content in enumerate(fetch_pages(urls, max_workers), 1):
         if html_content:
-            products = parse_products(html_content)
-            all_products.extend(products)
-            
-            # Be polite: add a small delay between requests
-            time.sleep(1)
+            yield from parse_products(html_content)
         else:
             print(f"Failed to fetch page {page_num}")
             break
-    
-    return all_products
 
 
-def save_to_csv(products: List[Dict[str, str]], filename: str = 'scraped_products.csv') -> bool:
+def save_to_csv(products: Iterable[Product], filename: str = 'scraped_products.csv',
+                append: bool = False) -> int:
     """
     Save product data to a CSV file.
     
+    Products are written as they are produced, so a generator from
+    scrape_multiple_pages is streamed to disk without being held in memory.
+    
     Args:
-        products: List of product dictionaries
+        products: Iterable of (name, price, rating) tuples
         filename: Name of the CSV file to create
+        append: Add rows to an existing file instead of creating a new one
     
     Returns:
-        True if successful, False otherwise
+        Number of products saved (0 if nothing was saved)
     """
+    # Look at the first product so an empty scrape creates no file
+    products = iter(products)
+    first = next(products, None)
+    if first is None:
+        print("No products to save!")
+        return 0
+    
+    # Only file and CSV errors are handled here; scraping errors raised by
+    # the products iterator are not disguised as save failures
     try:
-        if not products:
-            print("No products to save!")
-            return False
+        total = 0
         
-        # Define CSV headers
-        headers = ['Name', 'Price', 'Rating']
+        def counted_rows():
+            # Count the products as writerows pulls them from the stream
+            nonlocal total
+            for product in chain((first,), products):
+                total += 1
+                yield product
         
         # Write to CSV file
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
+        with open(filename, 'a' if append else 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
             
             # Write header row
-            writer.writeheader()
+            if not append:
+                writer.writerow(CSV_HEADERS)
             
             # Write product rows
-            writer.writerows(products)
+            writer.writerows(counted_rows())
         
         print(f"\n{'='*60}")
         print(f"✓ SUCCESS: Data successfully saved to '{filename}'")
-        print(f"✓ Total products scraped: {len(products)}")
+        print(f"✓ Total products scraped: {total}")
         print(f"{'='*60}\n")
         
-        return True
+        return total
     
-    except Exception as e:
+    except (OSError, csv.Error) as e:
         print(f"Error saving to CSV: {e}")
-        return False
+        return 0
+
+
+def record_columns(products: Iterable[Product], prices: array,
+                   ratings: array) -> Iterator[Product]:
+    """
+    Pass products through while recording their prices and ratings.
+    
+    The values are appended to typed arrays (float32 prices, uint8
+    ratings), which take a fraction of the memory of the string tuples, so
+    a streamed scrape can still be summarized without keeping its rows.
+    The stdlib array type is used because it grows as rows arrive, while
+    the total is unknown; display_rating_summary views it as NumPy arrays
+    without copying.
+    
+    Args:
+        products: Iterable of (name, price, rating) tuples
+        prices: array('f') receiving each price (NaN when missing)
+        ratings: array('B') receiving each rating (0 when missing)
+    
+    Yields:
+        The products, unchanged
+    """
+    for product in products:
+        prices.append(parse_price(product[1]))
+        ratings.append(_RATING_INT.get(product[2], 0))
+        yield product
+
+
+def display_rating_summary(prices: array, ratings: array):
+    """
+    Display how many products have each rating, and the average price.
+    
+    The typed arrays are viewed as NumPy arrays without copying and counted
+    with np.bincount. Requires NumPy; main() only records the columns when
+    it is installed.
+    
+    Args:
+        prices: array('f') of prices filled by record_columns
+        ratings: array('B') of ratings filled by record_columns
+    """
+    if not ratings:
+        return
+    
+    rating_values = np.frombuffer(ratings, dtype=np.uint8)
+    price_values = np.frombuffer(prices, dtype=np.float32)
+    counts = np.bincount(rating_values, minlength=6)
+    
+    out = ["="*60, "RATING SUMMARY:", "="*60]
+    for stars in range(5, 0, -1):
+        out.append(f"{stars}/5 stars: {counts[stars]}")
+    if counts[0]:
+        out.append(f"No rating: {counts[0]}")
+    if not np.isnan(price_values).all():
+        out.append(f"Average price: £{np.nanmean(price_values):.2f}")
+    out.append("="*60 + "\n")
+    
+    # One write for the whole block instead of a print() per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def display_sample_products(products: List[Dict[str, str]], num_samples: int = 5):
+def display_sample_products(products: List[Product], num_samples: int = 5):
     """
     Display a sample of scraped products.
     
     Args:
-        products: List of product dictionaries
+        products: List of (name, price, rating) tuples
         num_samples: Number of samples to display
     """
-    print("\n" + "="*60)
-    print("SAMPLE OF SCRAPED PRODUCTS:")
-    print("="*60)
+    out = ["\n" + "="*60, "SAMPLE OF SCRAPED PRODUCTS:", "="*60]
     
-    for i, product in enumerate(products[:num_samples], 1):
-        print(f"\n{i}. {product['Name']}")
-        print(f"   Price: {product['Price']}")
-        print(f"   Rating: {product['Rating']}/5 stars")
+    for i, (name, price, rating) in enumerate(products[:num_samples], 1):
+        out.append(f"\n{i}. {name}")
+        out.append(f"   Price: {price}")
+        out.append(f"   Rating: {rating}/5 stars")
     
-    print("\n" + "="*60 + "\n")
+    out.append("\n" + "="*60 + "\n")
+    
+    # One write for the whole block instead of a print() per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -235,29 +580,45 @@ def main():
     NUM_PAGES = 3  # Scrape 3 pages to get 20+ products
     OUTPUT_FILE = "scraped_products.csv"
     
-    # Step 1: Scrape products from multiple pages
+    # Step 1: Scrape products from multiple pages; nothing is fetched until
+    # the products are consumed below
     print("Starting web scraping process...\n")
     products = scrape_multiple_pages(BASE_URL, NUM_PAGES)
     
-    # Step 2: Check if we got enough products
-    if len(products) < 20:
-        print(f"\nWarning: Only scraped {len(products)} products. Attempting to scrape more pages...")
-        # Try scraping more pages if needed
-        additional_pages = scrape_multiple_pages(BASE_URL, 2)
-        products.extend(additional_pages)
+    # Step 2: Display sample products (only the first page has to arrive)
+    samples = list(islice(products, SAMPLE_SIZE))
+    if samples:
+        display_sample_products(samples)
     
-    # Step 3: Display sample products
-    if products:
-        display_sample_products(products)
+    # Step 3: Stream the samples and the remaining products to CSV, keeping
+    # typed price and rating columns for the summary if NumPy is installed
+    prices, ratings = array('f'), array('B')
+    products = chain(samples, products)
+    if np is not None:
+        products = record_columns(products, prices, ratings)
+    total = save_to_csv(products, OUTPUT_FILE)
+    
+    # Step 4: Check if we got enough products
+    if total < 20:
+        print(f"\nWarning: Only scraped {total} products. Attempting to scrape more pages...")
+        # Try scraping more pages if needed
+        additional_products = scrape_multiple_pages(BASE_URL, 2)
+        if not samples:
+            samples = list(islice(additional_products, SAMPLE_SIZE))
+            if samples:
+                display_sample_products(samples)
+            additional_products = chain(samples, additional_products)
+        if np is not None:
+            additional_products = record_columns(additional_products, prices, ratings)
+        total += save_to_csv(additional_products, OUTPUT_FILE, append=total > 0)
     
-    # Step 4: Save to CSV
-    if products:
-        save_to_csv(products, OUTPUT_FILE)
-    else:
+    if not total:
         print("No products were scraped. Please check the website URL and try again.")
         return
     
     # Step 5: Final summary
+    if np is not None:
+        display_rating_summary(prices, ratings)
     print(f"Scraping complete! Check '{OUTPUT_FILE}' for all scraped data.")
 
 